@@ -292,23 +292,34 @@ class Hypern:
         The method then adds routes to the application for serving the OpenAPI schema and the Swagger UI documentation.
         """
 
-        def schema(*args, **kwargs):
-            schemas = SchemaGenerator(
-                {
-                    "openapi": "3.0.0",
-                    "info": info.model_dump(),
-                    "components": {"securitySchemes": {}},
-                }
-            )
-            return JSONResponse(content=orjson.dumps(schemas.get_schema(self)))
+        schemas = SchemaGenerator(
+            {
+                "openapi": "3.0.0",
+                "info": info.model_dump(),
+                "components": {"securitySchemes": {}},
+            }
+        )
+        # routes are fixed once the server runs, so the schema is serialized on the first request only
+        schema_content: bytes | None = None
 
-        def template_render(*args, **kwargs):
-            swagger = SwaggerUI(
+        def schema(*args, **kwargs):
+            nonlocal schema_content
+            if schema_content is None:
+                schema_content = orjson.dumps(schemas.get_schema(self))
+            return JSONResponse(content=schema_content)
+
+        # the Swagger UI page only depends on openapi_url, render it once
+        swagger_template = (
+            SwaggerUI(
                 title="Swagger",
                 openapi_url=openapi_url,
             )
-            template = swagger.get_html_content()
-            return HTMLResponse(template)
+            .get_html_content()
+            .encode("utf-8")
+        )
+
+        def template_render(*args, **kwargs):
+            return HTMLResponse(swagger_template)
 
         self.add_route(HTTPMethod.GET, openapi_url, schema)
         self.add_route(HTTPMethod.GET, docs_url, template_render)
@@ -1,2 +1,3 @@
 class Authorization:
-    pass
+    # no instance dict on the base, subclasses that declare __slots__ stay dict-free
+    __slots__ = ()
@@ -188,9 +188,12 @@ def cache_with_strategy(strategy: CacheStrategy, key_prefix: str | None = None,
     """
 
     def decorator(func):
+        # the key prefix is fixed per function, resolve it once
+        prefix = key_prefix or func.__name__
+
         async def wrapper(*args, **kwargs):
             # Generate cache key
-            cache_key = f"{key_prefix or func.__name__}:{hash(str(args) + str(kwargs))}"
+            cache_key = f"{prefix}:{hash(str(args) + str(kwargs))}"
 
             result = await strategy.get(cache_key)
             if result is not None:
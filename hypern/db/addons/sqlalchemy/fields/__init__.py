@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
+from hypern.security import AESEngine
+
 from .ts_vector import TSVector
 from .datetime import DatetimeType
 from .password import PasswordType
-from .encrypted import StringEncryptType, LargeBinaryEncryptType, AESEngine
+from .encrypted import StringEncryptType, LargeBinaryEncryptType
 
 __all__ = [
     "TSVector",
@@ -1,11 +1,10 @@
 # -*- coding: utf-8 -*-
-import os
+import functools
 import typing
 
-from cryptography.hazmat.primitives import padding
 from sqlalchemy.types import LargeBinary, String, TypeDecorator
 
-from hypern.security import AESEngine, EDEngine
+from hypern.security import EDEngine, get_default_engine
 
 
 class StringEncryptType(TypeDecorator):
@@ -15,13 +14,13 @@ class StringEncryptType(TypeDecorator):
     def __init__(self, engine: typing.Optional[EDEngine] = None, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-        if not engine:
-            key = os.urandom(32)
-            iv = os.urandom(16)
-            padding_class = padding.PKCS7
-            self.engine = AESEngine(secret_key=key, iv=iv, padding_class=padding_class)
-        else:
-            self.engine = engine  # type: ignore
+        if engine:
+            self.engine = engine
+
+    @functools.cached_property
+    def engine(self) -> EDEngine:
+        # resolved on first use, so importing a model does not need HYPERN_AES_KEY
+        return get_default_engine()
 
     def process_bind_param(self, value, dialect):
         if value is None:
@@ -46,13 +45,12 @@ class LargeBinaryEncryptType(StringEncryptType):
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
-        value = super().process_bind_param(value, dialect)
-        if isinstance(value, str):
-            return value.encode("utf-8")
-        return value
+        if not isinstance(value, str):
+            raise ValueError("Value String Encrypt Type must be a string")
+        # Binary column, store the raw ciphertext without base64
+        return self.engine.encrypt_bytes(value)
 
     def process_result_value(self, value, dialect):
-        if isinstance(value, bytes):
-            value = value.decode("utf-8")
-            return super().process_result_value(value, dialect)
+        if isinstance(value, (bytes, memoryview)):
+            return self.engine.decrypt_bytes(bytes(value))
         return value
@@ -5,10 +5,16 @@ class UnicodeField(TypeDecorator):
     impl = Unicode
 
     def process_bind_param(self, value, dialect):
-        try:
-            value.encode("utf-8")
-        except UnicodeEncodeError:
+        if value is None:
+            return value
+        if not isinstance(value, str):
             raise ValueError("Value must be valid Unicode")
+        # ASCII strings are always valid UTF-8; only non-ASCII text can carry lone surrogates
+        if not value.isascii():
+            try:
+                value.encode("utf-8")
+            except UnicodeEncodeError:
+                raise ValueError("Value must be valid Unicode")
         return value
 
     def process_result_value(self, value, dialect):
@@ -1,33 +1,32 @@
-import os
+from functools import cached_property
 from typing import Any, Optional
 from mongoengine.base import BaseField
 
-from cryptography.hazmat.primitives import padding
-
-from hypern.security import EDEngine, AESEngine
+from hypern.security import EDEngine, get_default_engine
 
 
 class EncryptedField(BaseField):
     """
-    A custom MongoEngine field that encrypts data using AES-256-CBC.
+    A custom MongoEngine field that encrypts data using AES-256-GCM.
 
     The field automatically handles encryption when saving to MongoDB and
     decryption when retrieving data.
 
     Attributes:
-        engine: Encryption engine to use. If not provided, will use AES-256-CBC
+        engine: Encryption engine to use. If not provided, will use the process-wide AES-256-GCM engine keyed by HYPERN_AES_KEY,
+            resolved the first time a value is encrypted or decrypted
     """
 
     def __init__(self, engine: Optional[EDEngine] = None, **kwargs):
-        if not engine:
-            key = os.urandom(32)
-            iv = os.urandom(16)
-            padding_class = padding.PKCS7
-            self.engine = AESEngine(secret_key=key, iv=iv, padding_class=padding_class)
-        else:
-            self.engine = engine  # type: ignore
+        if engine:
+            self.engine = engine
         super(EncryptedField, self).__init__(**kwargs)
 
+    @cached_property
+    def engine(self) -> EDEngine:
+        # resolved on first use, so importing a document does not need HYPERN_AES_KEY
+        return get_default_engine()
+
     def to_mongo(self, value: Any) -> Optional[str]:
         """Convert a Python object to a MongoDB-compatible format."""
         if value is None:
@@ -1,5 +1,4 @@
 from mongoengine.base import BaseField
-import weakref
 from passlib.context import CryptContext
 import re
 from typing import Optional, Any
@@ -7,10 +6,18 @@ from typing import Optional, Any
 
 class PasswordField(BaseField):
     """
-    A custom password field using passlib for hashing and weakref for reference management.
+    A custom password field using passlib for hashing.
     Supports multiple hashing schemes and automatic upgrade of hash algorithms.
+
+    Argon2 cost can be tuned per field: lower it for high-throughput internal
+    credentials, keep or raise it for long-lived user passwords. Calibrate the
+    parameters so a single hash fits the latency budget of the login path.
     """
 
+    ARGON2_ROUNDS = 4
+    ARGON2_MEMORY_COST = 65536
+    ARGON2_PARALLELISM = 2
+
     # Class-level password context - shared across all instances
     pwd_context = CryptContext(
         # List of hashing schemes in order of preference
@@ -18,9 +25,9 @@ class PasswordField(BaseField):
         # Mark argon2 as default
         default="argon2",
         # Argon2 parameters
-        argon2__rounds=4,
-        argon2__memory_cost=65536,
-        argon2__parallelism=2,
+        argon2__rounds=ARGON2_ROUNDS,
+        argon2__memory_cost=ARGON2_MEMORY_COST,
+        argon2__parallelism=ARGON2_PARALLELISM,
         # PBKDF2 parameters
         pbkdf2_sha256__rounds=29000,
     )
@@ -32,6 +39,9 @@ class PasswordField(BaseField):
         require_special: bool = False,
         require_uppercase: bool = False,
         require_lowercase: bool = False,
+        argon2_rounds: int = ARGON2_ROUNDS,
+        argon2_memory_cost: int = ARGON2_MEMORY_COST,
+        argon2_parallelism: int = ARGON2_PARALLELISM,
         **kwargs,
     ):
         """
@@ -43,6 +53,9 @@ class PasswordField(BaseField):
             require_special: Require at least one special character
             require_uppercase: Require at least one uppercase letter
             require_lowercase: Require at least one lowercase letter
+            argon2_rounds: Argon2 time cost (iterations)
+            argon2_memory_cost: Argon2 memory cost in KiB
+            argon2_parallelism: Argon2 parallelism (lanes)
         """
         self.min_length = min_length
         self.require_number = require_number
@@ -50,8 +63,14 @@ class PasswordField(BaseField):
         self.require_uppercase = require_uppercase
         self.require_lowercase = require_lowercase
 
-        # Use weakref to store references to parent documents
-        self.instances = weakref.WeakKeyDictionary()
+        # Only build a dedicated context when the cost differs from the shared one
+        argon2_params = (argon2_rounds, argon2_memory_cost, argon2_parallelism)
+        if argon2_params != (self.ARGON2_ROUNDS, self.ARGON2_MEMORY_COST, self.ARGON2_PARALLELISM):
+            self.pwd_context = self.pwd_context.copy(
+                argon2__rounds=argon2_rounds,
+                argon2__memory_cost=argon2_memory_cost,
+                argon2__parallelism=argon2_parallelism,
+            )
 
         kwargs["required"] = True
         super(PasswordField, self).__init__(**kwargs)
@@ -95,24 +114,21 @@ class PasswordField(BaseField):
             return False, None
 
     def __get__(self, instance, owner):
-        """Custom getter using weakref."""
+        """Custom getter reading the hash from the document data."""
         if instance is None:
             return self
-        return self.instances.get(instance)
+        return instance._data.get(self.name)
 
     def __set__(self, instance, value):
-        """Custom setter using weakref."""
+        """Custom setter storing the hash in the document data."""
         if value and isinstance(value, str):
             # Validate and hash new password
             is_valid, error = self.validate_password(value)
             if not is_valid:
                 raise ValueError(error)
-            hashed = self.hash_password(value)
-            self.instances[instance] = hashed
-            instance._data[self.name] = hashed
+            instance._data[self.name] = self.hash_password(value)
         else:
             # If it's already hashed or None
-            self.instances[instance] = value
             instance._data[self.name] = value
 
     def to_mongo(self, value: str) -> Optional[str]:
@@ -3,8 +3,12 @@ from mongoengine import StringField
 
 class UnicodeField(StringField):
     def validate(self, value):
-        try:
-            value.encode("utf-8")
-        except UnicodeEncodeError:
+        if not isinstance(value, str):
             self.error("Value must be valid Unicode")
+        # ASCII strings are always valid UTF-8; only non-ASCII text can carry lone surrogates
+        if not value.isascii():
+            try:
+                value.encode("utf-8")
+            except UnicodeEncodeError:
+                self.error("Value must be valid Unicode")
         return True
@@ -2,7 +2,14 @@
 from enum import Enum
 
 
-class ErrorCode(Enum):
+class ErrorCode(str, Enum):
+    """
+    Members are plain strings (like enum.StrEnum, which needs Python 3.11),
+    usable directly wherever an error code string is expected.
+    """
+
+    __str__ = str.__str__
+
     UNKNOWN_ERROR = "UNKNOWN_ERROR"
     BAD_REQUEST = "BAD_REQUEST"
     FORBIDDEN = "FORBIDDEN"
@@ -45,7 +45,7 @@ class Proxy:
                     url=target_url,
                     headers=headers,
                     params=request.query_params.to_dict(),
-                    data=await request.json() if request.method in ["POST", "PUT", "PATCH"] else None,
+                    data=await request.json() if request.method in {"POST", "PUT", "PATCH"} else None,
                     timeout=aiohttp.ClientTimeout(total=service.timeout),
                 ) as response:
                     body = await response.read()
@@ -1,10 +1,11 @@
+import copy
 import hashlib
 import hmac
 import secrets
+import threading
 import time
 from base64 import b64decode, b64encode
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import jwt
@@ -14,6 +15,11 @@ from hypern.hypern import Request, Response
 from .base import Middleware, MiddlewareConfig
 
 
+# Verified JWT payloads are reused for at most this many seconds, and never past their exp
+_JWT_CACHE_TTL = 30
+_JWT_CACHE_SIZE = 4096
+
+
 @dataclass
 class CORSConfig:
     allowed_origins: List[str]
@@ -51,6 +57,10 @@ class SecurityMiddleware(Middleware):
         self._secret_key = secrets.token_bytes(32)
         self._token_lifetime = 3600
         self._rate_limit_storage = {}
+        self._jwt_algorithms = [secur_config.jwt_algorithm]
+        self._jwt_verify_key = None
+        self._jwt_cache: Dict[str, tuple] = {}
+        self._jwt_cache_lock = threading.Lock()
 
     def _rate_limit_check(self, request: Request) -> Optional[Response]:
         """Check if the request exceeds rate limits"""
@@ -78,23 +88,58 @@ class SecurityMiddleware(Middleware):
         if not self.secur_config.jwt_secret:
             raise ValueError("JWT secret key is not configured")
 
+        # PyJWT stores both claims as epoch seconds, read the clock once and skip the datetime objects
+        now = int(time.time())
         payload = {
             "user": user_data,
-            "exp": datetime.now(tz=timezone.utc) + timedelta(seconds=self.secur_config.jwt_expires_in),
-            "iat": datetime.now(tz=timezone.utc),
+            "exp": now + self.secur_config.jwt_expires_in,
+            "iat": now,
         }
         return jwt.encode(payload, self.secur_config.jwt_secret, algorithm=self.secur_config.jwt_algorithm)
 
+    def _get_jwt_verify_key(self) -> Any:
+        """
+        Parse the verification key once, PyJWT passes already prepared keys through as they are.
+        Asymmetric algorithms verify with the public half of the configured key.
+        """
+        if self._jwt_verify_key is None:
+            key = jwt.get_algorithm_by_name(self.secur_config.jwt_algorithm).prepare_key(self.secur_config.jwt_secret)
+            if hasattr(key, "public_key"):
+                key = key.public_key()
+            self._jwt_verify_key = key
+        return self._jwt_verify_key
+
     def _verify_jwt_token(self, token: str) -> Dict[str, Any]:
-        """Verify JWT token and return payload"""
+        """
+        Verify JWT token and return payload.
+        A token verified in the last _JWT_CACHE_TTL seconds skips the signature check.
+        Callers always get their own copy of the payload, the cached one is never handed out.
+        """
+        now = time.time()
+        cached = self._jwt_cache.get(token)
+        if cached is not None and cached[1] > now:
+            return copy.deepcopy(cached[0])
         try:
-            payload = jwt.decode(token, self.secur_config.jwt_secret, algorithms=[self.secur_config.jwt_algorithm])
-            return payload
+            # single verified decode, tokens without an expiry are rejected by PyJWT itself
+            payload = jwt.decode(
+                token,
+                self._get_jwt_verify_key(),
+                algorithms=self._jwt_algorithms,
+                options={"require": ["exp"]},
+            )
         except jwt.ExpiredSignatureError:
+            self._jwt_cache.pop(token, None)
             raise Unauthorized("Token has expired")
         except jwt.InvalidTokenError:
             raise Unauthorized("Invalid token")
 
+        with self._jwt_cache_lock:
+            if len(self._jwt_cache) >= _JWT_CACHE_SIZE:
+                # drop the oldest entry, dicts keep insertion order
+                self._jwt_cache.pop(next(iter(self._jwt_cache)), None)
+            self._jwt_cache[token] = (payload, min(payload["exp"], now + _JWT_CACHE_TTL))
+        return copy.deepcopy(payload)
+
     def _generate_csrf_token(self, session_id: str) -> str:
         """Generate a new CSRF token"""
         timestamp = str(int(time.time()))
@@ -153,17 +198,16 @@ class SecurityMiddleware(Middleware):
 
         # JWT authentication check
         if self.secur_config.jwt_auth:
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
+            scheme, _, token = (request.headers.get("Authorization") or "").partition(" ")
+            if not token or scheme.lower() != "bearer":
                 raise Unauthorized("Missing or invalid authorization header")
-            token = auth_header.split(" ")[1]
             try:
                 request.user = self._verify_jwt_token(token)
             except Unauthorized as e:
                 return Response(status_code=401, description=str(e))
 
         # CSRF protection check
-        if self.secur_config.csrf_protection and request.method in ["POST", "PUT", "DELETE", "PATCH"]:
+        if self.secur_config.csrf_protection and request.method in {"POST", "PUT", "DELETE", "PATCH"}:
             csrf_token = request.headers.get("X-CSRF-Token")
             if not csrf_token or not self._validate_csrf_token(csrf_token):
                 raise Forbidden("CSRF token missing or invalid")
@@ -5,6 +5,19 @@ from hypern.hypern import BaseSchemaGenerator, Route as InternalRoute
 import typing
 import orjson
 
+_HTTP_METHOD_MAP = {
+    "GET": "get",
+    "POST": "post",
+    "PUT": "put",
+    "PATCH": "patch",
+    "DELETE": "delete",
+    "OPTIONS": "options",
+    "HEAD": "head",
+}
+
+# Parsed operation objects keyed by docstring (or by the route's docs renderer), shared by every schema build
+_DOCSTRING_CACHE: dict[str | typing.Callable[[], str], dict[str, typing.Any] | None] = {}
+
 
 class EndpointInfo(typing.NamedTuple):
     path: str
@@ -30,24 +43,59 @@ class SchemaGenerator(BaseSchemaGenerator):
         endpoints_info: list[EndpointInfo] = []
 
         for route in routes:
-            method = route.method.lower()
+            method = _HTTP_METHOD_MAP.get(route.method) or route.method.lower()
             endpoints_info.append(EndpointInfo(path=route.path, http_method=method, func=route.function.handler))
         return endpoints_info
 
+    def load_docstring(self, func: typing.Callable[..., typing.Any]) -> dict[str, typing.Any] | None:
+        """
+        Parse the OpenAPI operation from the docstring of `func`, caching the result by docstring.
+        """
+        # routes defer rendering their generated docs until the schema is first requested
+        # the renderer is left on the handler and its output cached under the renderer itself,
+        # so concurrent first requests only render twice instead of racing on the attribute
+        render_docs = getattr(func, "_swagger_docs", None)
+        if render_docs is not None:
+            try:
+                return _DOCSTRING_CACHE[render_docs]
+            except KeyError:
+                pass
+            # generated docs are JSON, no need to go through the YAML parser
+            operation = _DOCSTRING_CACHE[render_docs] = orjson.loads(render_docs())
+            return operation
+
+        docstring = getattr(func, "__doc__", None)
+        if not docstring:
+            return None
+        try:
+            return _DOCSTRING_CACHE[docstring]
+        except KeyError:
+            pass
+        operation = None
+        # the operation is the YAML mapping after the last "---", a plain text docstring has none
+        if ":" in docstring.rpartition("---")[2]:
+            parsed = self.parse_docstring(func)
+            operation = orjson.loads(parsed) if parsed else None
+            if not isinstance(operation, dict):
+                operation = None
+        _DOCSTRING_CACHE[docstring] = operation
+        return operation
+
     def get_schema(self, app) -> dict[str, typing.Any]:
-        schema = dict(self.base_schema)
-        schema.setdefault("paths", {})
+        # shallow copy, only "paths" and its path items are written to so only those are copied
+        paths = {path: dict(item) for path, item in self.base_schema.get("paths", {}).items()}
+        schema = {**self.base_schema, "paths": paths}
         endpoints_info = self.get_endpoints(app.router.routes)
 
         for endpoint in endpoints_info:
-            parsed = self.parse_docstring(endpoint.func)
+            operation = self.load_docstring(endpoint.func)
 
-            if not parsed:
+            if not operation:
                 continue
 
-            if endpoint.path not in schema["paths"]:
-                schema["paths"][endpoint.path] = {}
-
-            schema["paths"][endpoint.path][endpoint.http_method] = orjson.loads(parsed)
+            path_item = paths.get(endpoint.path)
+            if path_item is None:
+                path_item = paths[endpoint.path] = {}
+            path_item[endpoint.http_method] = operation
 
         return schema
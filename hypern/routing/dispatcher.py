@@ -6,6 +6,7 @@ import functools
 import inspect
 import traceback
 import typing
+import weakref
 
 import orjson
 from pydantic import BaseModel
@@ -18,17 +19,98 @@ from .parser import InputHandler
 from hypern.config import context_store
 
 
-def is_async_callable(obj: typing.Any) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _is_async_callable(obj: typing.Any) -> bool:
     while isinstance(obj, functools.partial):
-        obj = obj.funcz
+        obj = obj.func
     return asyncio.iscoroutinefunction(obj) or (callable(obj) and asyncio.iscoroutinefunction(obj.__call__))
 
 
+def is_async_callable(obj: typing.Any) -> bool:
+    try:
+        return _is_async_callable(obj)
+    except TypeError:
+        # unhashable callable, check it without the cache
+        return _is_async_callable.__wrapped__(obj)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_signature(func: typing.Callable) -> inspect.Signature:
+    try:
+        return inspect.signature(func, eval_str=True)
+    except Exception:
+        # annotation that cannot be evaluated (forward reference, bad expression), keep the raw annotations
+        return inspect.signature(func)
+
+
+def get_signature(func: typing.Callable) -> inspect.Signature:
+    """
+    Memoized inspect.signature, a handler's signature does not change once it is defined.
+    String annotations (e.g. under `from __future__ import annotations`) are resolved here, once per handler.
+    """
+    try:
+        return _get_signature(func)
+    except TypeError:
+        # unhashable callable, inspect it without the cache
+        return _get_signature.__wrapped__(func)
+
+
 async def run_in_threadpool(func: typing.Callable, *args, **kwargs):
-    if kwargs:  # pragma: no cover
-        # run_sync doesn't accept 'kwargs', so bind them in here
-        func = functools.partial(func, **kwargs)
-    return await asyncio.to_thread(func, *args)
+    # runs on the loop's default executor, worker threads are reused and the current context is copied
+    return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# weak keys, handlers built on the fly (e.g. per request partials) are dropped with their handler
+_response_builders: weakref.WeakKeyDictionary[typing.Any, typing.Callable[[typing.Any], Response]] = weakref.WeakKeyDictionary()
+
+
+# {"message": <content>, "error_code": null}, the envelope is constant so only the content is serialized
+_JSON_ENVELOPE_HEAD = b'{"message":'
+_JSON_ENVELOPE_TAIL = b',"error_code":null}'
+
+
+def _json_response(content: typing.Any) -> Response:
+    return JSONResponse(
+        content=b"".join((_JSON_ENVELOPE_HEAD, orjson.dumps(content), _JSON_ENVELOPE_TAIL)),
+        status_code=200,
+    )
+
+
+def _make_response_builder(return_annotation: typing.Any) -> typing.Callable[[typing.Any], Response]:
+    if isinstance(return_annotation, type) and issubclass(return_annotation, BaseModel):
+        model = return_annotation
+
+        def builder(response: typing.Any) -> Response:
+            if isinstance(response, Response):
+                return response
+            if not isinstance(response, model):
+                response = model.model_validate(response)
+            return _json_response(response.model_dump(mode="json"))
+
+    else:
+
+        def builder(response: typing.Any) -> Response:
+            if isinstance(response, Response):
+                return response
+            return _json_response(response)
+
+    return builder
+
+
+def _get_response_builder(handler: typing.Callable, return_annotation: typing.Any) -> typing.Callable[[typing.Any], Response]:
+    """
+    Return the function turning a handler result into a Response.
+    The decision depends only on the handler's return annotation, so it is made once per handler.
+    """
+    key = getattr(handler, "__func__", handler)
+    try:
+        builder = _response_builders.get(key)
+        if builder is None:
+            builder = _response_builders[key] = _make_response_builder(return_annotation)
+    except TypeError:
+        # unhashable or not weak referenceable handler, build it without the cache
+        builder = _make_response_builder(return_annotation)
+    return builder
 
 
 async def dispatch(handler, request: Request, inject: typing.Dict[str, typing.Any]) -> Response:
@@ -37,22 +119,16 @@ async def dispatch(handler, request: Request, inject: typing.Dict[str, typing.An
         context_store.set_context(request.context_id)
 
         is_async = is_async_callable(handler)
-        signature = inspect.signature(handler)
+        signature = get_signature(handler)
         input_handler = InputHandler(request)
-        _response_type = signature.return_annotation
+        build_response = _get_response_builder(handler, signature.return_annotation)
         _kwargs = await input_handler.get_input_handler(signature, inject)
 
         if is_async:
             response = await handler(**_kwargs)  # type: ignore
         else:
             response = await run_in_threadpool(handler, **_kwargs)
-        if not isinstance(response, Response):
-            if isinstance(_response_type, type) and issubclass(_response_type, BaseModel):
-                response = _response_type.model_validate(response).model_dump(mode="json")  # type: ignore
-            response = JSONResponse(
-                content=orjson.dumps({"message": response, "error_code": None}),
-                status_code=200,
-            )
+        response = build_response(response)
 
     except Exception as e:
         _res: typing.Dict = {"message": "", "error_code": "UNKNOWN_ERROR"}
@@ -11,20 +11,34 @@ from hypern.response import JSONResponse
 
 from .dispatcher import dispatch
 
+_METHOD_NOT_ALLOWED_BODY = orjson.dumps({"message": "Method Not Allowed", "error_code": "METHOD_NOT_ALLOW"})
+
+
+_HTTP_METHODS = ("get", "head", "post", "put", "patch", "delete", "options", "trace", "connect")
+
 
 class HTTPEndpoint:
+    # request method (upper case) -> name of the handler method, filled per subclass
+    _method_table: Dict[str, str] = {}
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        table = {name.upper(): name for name in _HTTP_METHODS if hasattr(cls, name)}
+        if "HEAD" not in table and "GET" in table:
+            table["HEAD"] = "get"
+        cls._method_table = table
+
     def method_not_allowed(self, request: Request) -> Response:
-        return JSONResponse(
-            description=orjson.dumps({"message": "Method Not Allowed", "error_code": "METHOD_NOT_ALLOW"}),
-            status_code=405,
-        )
+        return JSONResponse(content=_METHOD_NOT_ALLOWED_BODY, status_code=405)
 
     async def dispatch(self, request: Request, inject: Dict[str, Any]) -> Response:
-        handler_name = "get" if request.method == "HEAD" and not hasattr(self, "head") else request.method.lower()
-        handler: typing.Callable[[Request], typing.Any] = getattr(  # type: ignore
-            self, handler_name, self.method_not_allowed
-        )
+        handler_name = self._method_table.get(request.method)
+        if handler_name is None:
+            # handlers added after the class was defined (class decorators, setattr) are not in the table
+            handler_name = "get" if request.method == "HEAD" and not hasattr(self, "head") else request.method.lower()
+        # looked up on the instance, so staticmethods, classmethods and instance attributes bind as usual
+        handler: typing.Callable[[Request], typing.Any] = getattr(self, handler_name, self.method_not_allowed)  # type: ignore
         return await dispatch(handler, request, inject)
@@ -1,12 +1,12 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import functools
 import inspect
 import typing
 
 import orjson
 from pydantic import BaseModel, ValidationError
-from pydash import get
 
 from hypern.auth.authorization import Authorization
 from hypern.exceptions import BadRequest
@@ -15,86 +15,116 @@ from hypern.hypern import Request
 
 
 class ParamParser:
+    _data_names = frozenset({"query_params", "path_params", "form_data"})
+
     def __init__(self, request: Request):
         self.request = request
 
     def parse_data_by_name(self, param_name: str) -> dict:
         param_name = param_name.lower()
-        data_parsers = {
-            "query_params": self._parse_query_params,
-            "path_params": self._parse_path_params,
-            "form_data": self._parse_form_data,
-        }
-
-        parser = data_parsers.get(param_name)
-        if not parser:
+        if param_name not in self._data_names:
             raise BadRequest(msg="Backend Error: Invalid parameter type, must be query_params, path_params or form_data.")
-        return parser()
+        return getattr(self, param_name)
 
-    def _parse_query_params(self) -> dict:
+    @functools.cached_property
+    def query_params(self) -> dict:
         query_params = self.request.query_params.to_dict()
         return {k: v[0] for k, v in query_params.items()}
 
-    def _parse_path_params(self) -> dict:
-        return lambda: dict(self.request.path_params.items())
+    @functools.cached_property
+    def path_params(self) -> dict:
+        return dict(self.request.path_params.items())
 
-    def _parse_form_data(self) -> dict:
+    @functools.cached_property
+    def form_data(self) -> dict:
         return self.request.json()
 
 
+# How each handler parameter gets its value, decided once per signature
+_PARAM_MODEL = 0
+_PARAM_AUTH = 1
+_PARAM_REQUEST = 2
+_PARAM_INJECT = 3
+
+_param_plans: typing.Dict[inspect.Signature, typing.Tuple[typing.Tuple[str, int, typing.Any], ...]] = {}
+
+
+def _build_param_plan(signature: inspect.Signature) -> typing.Tuple[typing.Tuple[str, int, typing.Any], ...]:
+    plan = []
+    for param in signature.parameters.values():
+        name = param.name
+        ptype = param.annotation
+        if isinstance(ptype, type) and issubclass(ptype, BaseModel):
+            plan.append((name, _PARAM_MODEL, ptype))
+        elif isinstance(ptype, type) and issubclass(ptype, Authorization):
+            plan.append((name, _PARAM_AUTH, ptype))
+        elif name == "request":
+            plan.append((name, _PARAM_REQUEST, ptype))
+        else:
+            plan.append((name, _PARAM_INJECT, ptype))
+    return tuple(plan)
+
+
+def get_param_plan(signature: inspect.Signature) -> typing.Tuple[typing.Tuple[str, int, typing.Any], ...]:
+    """
+    Return the (name, kind, annotation) plan of a handler signature, built on first use.
+    """
+    try:
+        return _param_plans[signature]
+    except KeyError:
+        plan = _param_plans[signature] = _build_param_plan(signature)
+        return plan
+    except TypeError:
+        # unhashable annotation, nothing to cache on
+        return _build_param_plan(signature)
+
+
 class InputHandler:
     def __init__(self, request):
         self.request = request
-        self.param_parser = ParamParser(request)
+
+    @functools.cached_property
+    def param_parser(self) -> ParamParser:
+        return ParamParser(self.request)
 
     async def parse_pydantic_model(self, param_name: str, model_class: typing.Type[BaseModel]) -> BaseModel:
         try:
             data = self.param_parser.parse_data_by_name(param_name)
-            return model_class(**data)
+            return model_class.model_validate(data)
         except ValidationError as e:
-            invalid_fields = orjson.loads(e.json())
+            invalid_fields = e.errors(include_url=False, include_context=False, include_input=False)
             raise HypernValidationError(
                 msg=orjson.dumps(
                     [
                         {
-                            "field": get(item, "loc")[0],
-                            "msg": get(item, "msg"),
+                            "field": item["loc"][0],
+                            "msg": item["msg"],
                         }
                         for item in invalid_fields
                     ]
                 ).decode("utf-8"),
             )
 
-    async def handle_special_params(self, param_name: str) -> typing.Any:
-        special_params = {
-            "request": lambda: self.request,
-        }
-        return special_params.get(param_name, lambda: None)()
-
     async def get_input_handler(self, signature: inspect.Signature, inject: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
         """
         Parse the request data and return the kwargs for the handler
         """
         kwargs = {}
 
-        for param in signature.parameters.values():
-            name = param.name
-            ptype = param.annotation
-
+        for name, kind, ptype in get_param_plan(signature):
             # Handle Pydantic models
-            if isinstance(ptype, type) and issubclass(ptype, BaseModel):
+            if kind == _PARAM_MODEL:
                 kwargs[name] = await self.parse_pydantic_model(name, ptype)
                 continue
 
             # Handle Authorization
-            if isinstance(ptype, type) and issubclass(ptype, Authorization):
+            if kind == _PARAM_AUTH:
                 kwargs[name] = await ptype().validate(self.request)
                 continue
 
             # Handle special parameters
-            special_value = await self.handle_special_params(name)
-            if special_value is not None:
-                kwargs[name] = special_value
+            if kind == _PARAM_REQUEST:
+                kwargs[name] = self.request
             if name in inject:
                 kwargs[name] = inject[name]
         return kwargs
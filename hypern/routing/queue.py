@@ -5,11 +5,17 @@ from dataclasses import dataclass, field
 from queue import PriorityQueue
 from typing import Any, Dict
 
+import orjson
+
 from hypern.hypern import Request, Response
 from hypern.response import JSONResponse
 from hypern.routing import HTTPEndpoint
 from hypern.logging import logger
 
+_QUEUE_FULL_MESSAGE = "Request queue is full"
+_QUEUE_FULL_BODY = orjson.dumps({"error": "Server too busy", "message": _QUEUE_FULL_MESSAGE, "retry_after": 5})
+_QUEUE_TIMEOUT_BODY = orjson.dumps({"error": "Request timeout", "message": "Request timed out while waiting in queue"})
+
 
 @dataclass(order=True)
 class PrioritizedRequest:
@@ -43,7 +49,7 @@ class QueuedHTTPEndpoint(HTTPEndpoint):
         # Metrics
         self._metrics = {"processed_requests": 0, "queued_requests": 0, "rejected_requests": 0, "avg_wait_time": 0.0}
 
-        self._fully_message = "Request queue is full"
+        self._fully_message = _QUEUE_FULL_MESSAGE
 
     async def _initialize(self):
         """Initialize async components when first request arrives"""
@@ -139,17 +145,11 @@ class QueuedHTTPEndpoint(HTTPEndpoint):
                 return response
 
         except asyncio.QueueFull:
-            return JSONResponse(description={"error": "Server too busy", "message": self._fully_message, "retry_after": 5}, status_code=503)
+            return JSONResponse(content=_QUEUE_FULL_BODY, status_code=503)
         except asyncio.TimeoutError:
-            return JSONResponse(
-                description={
-                    "error": "Request timeout",
-                    "message": "Request timed out while waiting in queue",
-                },
-                status_code=504,
-            )
+            return JSONResponse(content=_QUEUE_TIMEOUT_BODY, status_code=504)
         except Exception as e:
-            return JSONResponse(description={"error": "Internal server error", "message": str(e)}, status_code=500)
+            return JSONResponse(content={"error": "Internal server error", "message": str(e)}, status_code=500)
 
     def _get_request_priority(self, request: Request) -> int:
         """
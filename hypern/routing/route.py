@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 import asyncio
+import functools
 import inspect
+import types
+import weakref
 from enum import Enum
 from typing import Any, Callable, Dict, List, Type, Union, get_args, get_origin
 
-import yaml  # type: ignore
+import orjson
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
@@ -13,7 +16,19 @@ from hypern.datastructures import HTTPMethod
 from hypern.hypern import FunctionInfo, Request, Router
 from hypern.hypern import Route as InternalRoute
 
-from .dispatcher import dispatch
+from .dispatcher import dispatch, get_signature
+
+# Parameter schemas of query/path models, keyed by model class then by location
+_MODEL_PARAMS_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, List[Dict[str, Any]]]]" = weakref.WeakKeyDictionary()
+
+# Schemas generated by pydantic_to_swagger, keyed by model class
+_MODEL_SCHEMA_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+# Rendered swagger docs keyed by everything swagger_generate reads
+_SWAGGER_DOCS_CACHE: Dict[tuple, str] = {}
+
+# typing.Union[...] and PEP 604 `X | Y` (types.UnionType, Python 3.10+) report different origins
+_UNION_ORIGINS = frozenset({Union, getattr(types, "UnionType", Union)})
 
 
 def get_field_type(field):
@@ -28,6 +43,10 @@ def pydantic_to_swagger(model: type[BaseModel] | dict):
             schema[name] = _process_field(name, field_type)
         return schema
 
+    schema = _MODEL_SCHEMA_CACHE.get(model)
+    if schema is not None:
+        return schema
+
     schema = {
         model.__name__: {
             "type": "object",
@@ -38,6 +57,7 @@ def pydantic_to_swagger(model: type[BaseModel] | dict):
     for name, field in model.model_fields.items():
         schema[model.__name__]["properties"][name] = _process_field(name, field)
 
+    _MODEL_SCHEMA_CACHE[model] = schema
     return schema
 
 
@@ -47,9 +67,8 @@ class SchemaProcessor:
         """Process Union types"""
         if type(None) in args:
             inner_type = next(arg for arg in args if arg is not type(None))
-            schema = SchemaProcessor._process_field("", inner_type)
-            schema["nullable"] = True
-            return schema
+            # copy, the inner schema may be a cached model schema
+            return {**SchemaProcessor._process_field("", inner_type), "nullable": True}
         return {"oneOf": [SchemaProcessor._process_field("", arg) for arg in args]}
 
     @staticmethod
@@ -60,8 +79,7 @@ class SchemaProcessor:
     @staticmethod
     def process_primitive(annotation: type) -> Dict[str, str]:
         """Process primitive types"""
-        type_mapping = {int: "integer", float: "number", str: "string", bool: "boolean"}
-        return {"type": type_mapping.get(annotation, "object")}
+        return {"type": _PRIMITIVE_TYPES.get(annotation, "object")}
 
     @staticmethod
     def process_list(annotation: type) -> Dict[str, Any]:
@@ -98,33 +116,39 @@ class SchemaProcessor:
 
         # Process Union types
         origin = get_origin(annotation)
-        if origin is Union:
+        if origin in _UNION_ORIGINS:
             return cls.process_union(get_args(annotation))
 
-        # Process Enum types
-        if isinstance(annotation, type) and issubclass(annotation, Enum):
-            return cls.process_enum(annotation)
-
-        # Process primitive types
-        if annotation in {int, float, str, bool}:
-            return cls.process_primitive(annotation)
+        # Process primitive, list and dict types, parametrized generics are keyed by their origin
+        try:
+            handler = _FIELD_HANDLERS.get(origin or annotation)
+        except TypeError:
+            handler = None
+        if handler is not None:
+            return handler(annotation)
 
-        # Process list types
-        if annotation == list or origin is list:  # noqa: E721
-            return cls.process_list(annotation)
+        if isinstance(annotation, type):
+            # Process Enum types
+            if issubclass(annotation, Enum):
+                return cls.process_enum(annotation)
 
-        # Process dict types
-        if annotation == dict or origin is dict:  # noqa: E721
-            return cls.process_dict(annotation)
-
-        # Process Pydantic models
-        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
-            return pydantic_to_swagger(annotation)
+            # Process Pydantic models
+            if issubclass(annotation, BaseModel):
+                return pydantic_to_swagger(annotation)
 
         # Fallback for complex types
         return {"type": "object"}
 
 
+_PRIMITIVE_TYPES = {int: "integer", float: "number", str: "string", bool: "boolean"}
+
+_FIELD_HANDLERS: Dict[Any, Callable[[Any], Dict[str, Any]]] = {
+    **{primitive: SchemaProcessor.process_primitive for primitive in _PRIMITIVE_TYPES},
+    list: SchemaProcessor.process_list,
+    dict: SchemaProcessor.process_dict,
+}
+
+
 def _process_field(name: str, field: Any) -> Dict[str, Any]:
     """
     Process a field and return its schema representation
@@ -140,6 +164,18 @@ def _process_field(name: str, field: Any) -> Dict[str, Any]:
 
 
 class Route:
+    __slots__ = ("path", "endpoint", "tags", "name", "functional_handlers")
+
+    _HTTP_METHODS = {
+        "GET": HTTPMethod.GET,
+        "POST": HTTPMethod.POST,
+        "PUT": HTTPMethod.PUT,
+        "DELETE": HTTPMethod.DELETE,
+        "PATCH": HTTPMethod.PATCH,
+        "HEAD": HTTPMethod.HEAD,
+        "OPTIONS": HTTPMethod.OPTIONS,
+    }
+
     def __init__(
         self,
         path: str,
@@ -152,36 +188,40 @@ class Route:
         self.endpoint = endpoint
         self.tags = tags or ["Default"]
         self.name = name
-
-        self.http_methods = {
-            "GET": HTTPMethod.GET,
-            "POST": HTTPMethod.POST,
-            "PUT": HTTPMethod.PUT,
-            "DELETE": HTTPMethod.DELETE,
-            "PATCH": HTTPMethod.PATCH,
-            "HEAD": HTTPMethod.HEAD,
-            "OPTIONS": HTTPMethod.OPTIONS,
-        }
-        self.functional_handlers = []
+        self.functional_handlers: List[InternalRoute] = []
 
     def _process_authorization(self, item: type, docs: Dict) -> None:
-        if isinstance(item, type) and issubclass(item, Authorization):
-            auth_obj = item()
-            docs["security"] = [{auth_obj.name: []}]
-
-    def _process_model_params(self, key: str, item: type, docs: Dict) -> None:
-        if not (isinstance(item, type) and issubclass(item, BaseModel)):
-            return
-
-        if key == "form_data":
-            docs["requestBody"] = {"content": {"application/json": {"schema": pydantic_to_swagger(item).get(item.__name__)}}}
-        elif key == "query_params":
-            docs["parameters"] = [{"name": param, "in": "query", "schema": _process_field(param, field)} for param, field in item.model_fields.items()]
-        elif key == "path_params":
-            path_params = [
-                {"name": param, "in": "path", "required": True, "schema": _process_field(param, field)} for param, field in item.model_fields.items()
-            ]
-            docs.setdefault("parameters", []).extend(path_params)
+        auth_obj = item()
+        docs["security"] = [{auth_obj.name: []}]
+
+    def _process_form_data(self, item: Type[BaseModel], docs: Dict) -> None:
+        docs["requestBody"] = {"content": {"application/json": {"schema": pydantic_to_swagger(item).get(item.__name__)}}}
+
+    def _process_query_params(self, item: Type[BaseModel], docs: Dict) -> None:
+        docs["parameters"] = list(self._get_model_params(item, "query"))
+
+    def _process_path_params(self, item: Type[BaseModel], docs: Dict) -> None:
+        docs.setdefault("parameters", []).extend(self._get_model_params(item, "path"))
+
+    # parameter name -> how its pydantic model is documented
+    _MODEL_PARAM_PROCESSORS = {
+        "form_data": _process_form_data,
+        "query_params": _process_query_params,
+        "path_params": _process_path_params,
+    }
+
+    def _get_model_params(self, item: Type[BaseModel], location: str) -> List[Dict[str, Any]]:
+        model_params = _MODEL_PARAMS_CACHE.setdefault(item, {})
+        params = model_params.get(location)
+        if params is None:
+            params = []
+            for param, field in item.model_fields.items():
+                param_schema = {"name": param, "in": location, "schema": _process_field(param, field)}
+                if location == "path":
+                    param_schema["required"] = True
+                params.append(param_schema)
+            model_params[location] = params
+        return params
 
     def _process_response(self, response_type: type, docs: Dict) -> None:
         if isinstance(response_type, type) and issubclass(response_type, BaseModel):
@@ -193,23 +233,40 @@ class Route:
             }
 
     def swagger_generate(self, signature: inspect.Signature, summary: str = "Document API") -> str:
+        key = (
+            tuple((param.name, param.annotation) for param in signature.parameters.values()),
+            signature.return_annotation,
+            tuple(self.tags),
+            self.name,
+            summary,
+        )
+        try:
+            return _SWAGGER_DOCS_CACHE[key]
+        except KeyError:
+            docs = _SWAGGER_DOCS_CACHE[key] = self._render_swagger(signature, summary)
+            return docs
+        except TypeError:
+            # unhashable annotation, render without caching
+            return self._render_swagger(signature, summary)
+
+    def _render_swagger(self, signature: inspect.Signature, summary: str) -> str:
         _inputs = signature.parameters.values()
         _inputs_dict = {_input.name: _input.annotation for _input in _inputs}
         _docs: Dict = {"summary": summary, "tags": self.tags, "responses": [], "name": self.name}
 
         for key, item in _inputs_dict.items():
-            self._process_authorization(item, _docs)
-            self._process_model_params(key, item, _docs)
+            if not isinstance(item, type):
+                continue
+            if issubclass(item, Authorization):
+                self._process_authorization(item, _docs)
+                continue
+            process = self._MODEL_PARAM_PROCESSORS.get(key)
+            if process is not None and issubclass(item, BaseModel):
+                process(self, item, _docs)
 
         self._process_response(signature.return_annotation, _docs)
-        return yaml.dump(_docs)
-
-    def _combine_path(self, path1: str, path2: str) -> str:
-        if path1.endswith("/") and path2.startswith("/"):
-            return path1 + path2[1:]
-        if not path1.endswith("/") and not path2.startswith("/"):
-            return path1 + "/" + path2
-        return path1 + path2
+        # JSON is valid YAML, so parse_docstring reads it as is while orjson emits it in C
+        return orjson.dumps(_docs).decode("utf-8")
 
     def make_internal_route(self, path, handler, method) -> InternalRoute:
         is_async = asyncio.iscoroutinefunction(handler)
@@ -223,23 +280,31 @@ class Route:
         if not self.endpoint and not self.functional_handlers:
             raise ValueError(f"No handler found for route: {self.path}")
 
-        # Handle functional routes
-        for h in self.functional_handlers:
-            router.add_route(route=self.make_internal_route(path=h["path"], handler=h["func"], method=h["method"].upper()))
+        # Handle functional routes, built when they were declared
+        for route in self.functional_handlers:
+            router.add_route(route=route)
         if not self.endpoint:
             return router
 
-        # Handle class-based routes
-        for name, func in self.endpoint.__dict__.items():
-            if name.upper() in self.http_methods:
-                sig = inspect.signature(func)
-                doc = self.swagger_generate(sig, func.__doc__)
-                self.endpoint.dispatch.__doc__ = doc
-                endpoint_obj = self.endpoint()
-                router.add_route(route=self.make_internal_route(path="/", handler=endpoint_obj.dispatch, method=name.upper()))
-                del endpoint_obj  # free up memory
+        # Handle class-based routes, all methods share one endpoint instance
+        endpoint_attrs = vars(self.endpoint)
+        endpoint_dispatch = self.endpoint().dispatch
+        for name in self._HTTP_METHODS:
+            func = endpoint_attrs.get(name.lower())
+            if func is not None:
+                # a partial per method so each route carries its own docs
+                handler = functools.partial(endpoint_dispatch)
+                self._defer_swagger_docs(handler, func)
+                router.add_route(route=self.make_internal_route(path="/", handler=handler, method=name))
         return router
 
+    def _defer_swagger_docs(self, handler: Callable[..., Any], func: Callable[..., Any]) -> None:
+        """
+        Attach a renderer for the swagger docs of `func` to `handler`.
+        The docs are only generated when the OpenAPI schema is requested, see SchemaGenerator.load_docstring.
+        """
+        handler._swagger_docs = functools.partial(self.swagger_generate, get_signature(func), func.__doc__)
+
     def add_route(
         self,
         path: str,
@@ -249,16 +314,8 @@ class Route:
             async def functional_wrapper(request: Request, inject: Dict[str, Any]) -> Any:
                 return await dispatch(func, request, inject)
 
-            sig = inspect.signature(func)
-            functional_wrapper.__doc__ = self.swagger_generate(sig, func.__doc__)
-
-            self.functional_handlers.append(
-                {
-                    "path": path,
-                    "method": method,
-                    "func": functional_wrapper,
-                }
-            )
+            self._defer_swagger_docs(functional_wrapper, func)
+            self.functional_handlers.append(self.make_internal_route(path=path, handler=functional_wrapper, method=method.upper()))
 
         return decorator
 
@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import os
+import threading
+import typing
 from abc import ABC, abstractmethod
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-from base64 import b64encode, b64decode
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-import typing
+try:
+    # SIMD accelerated base64 (SSSE3/AVX2/NEON) from the `speedups` extra, same API as the stdlib functions
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
+from hypern.config import EnvironError, environ
+from hypern.logging import logger
 
 
 class EDEngine(ABC):
@@ -16,29 +29,115 @@ class EDEngine(ABC):
     def decrypt(self, data: str) -> str:
         raise NotImplementedError("Method not implemented")
 
+    def encrypt_bytes(self, data: str) -> bytes:
+        """Encrypt to raw bytes, for binary storage. Engines may override it to skip the text encoding."""
+        value = self.encrypt(data)
+        return value.encode("utf-8") if isinstance(value, str) else value
+
+    def decrypt_bytes(self, data: bytes) -> str:
+        return self.decrypt(data.decode("utf-8"))
+
 
 class AESEngine(EDEngine):
-    def __init__(self, secret_key: bytes, iv: bytes, padding_class: typing.Type) -> None:
+    """
+    AES-GCM engine. Every message gets a fresh 96-bit nonce, stored in front of the
+    ciphertext (and its 16 bytes tag). encrypt/decrypt work on the base64 form of it,
+    encrypt_bytes/decrypt_bytes on the raw bytes. GCM needs no padding.
+
+    Since every message gets its own nonce, encrypting the same value twice gives different
+    ciphertexts, so encrypted columns can not be matched with an equality filter.
+
+    Values written by the previous engine (one fixed IV, PKCS7 padded) are still readable
+    when that IV is passed as `legacy_iv`, new values are always written in the new format.
+    """
+
+    NONCE_SIZE = 12
+    TAG_SIZE = 16
+
+    def __init__(
+        self,
+        secret_key: bytes,
+        iv: typing.Optional[bytes] = None,
+        padding_class: typing.Optional[typing.Type] = None,
+        *,
+        legacy_iv: typing.Optional[bytes] = None,
+    ) -> None:
+        if iv is not None or padding_class is not None:
+            raise TypeError(
+                "AESEngine no longer takes iv and padding_class, it uses a random nonce per message and no padding. "
+                "Use AESEngine(secret_key, legacy_iv=iv) to keep decrypting values written with that IV."
+            )
         super().__init__()
         self.secret_key = secret_key
-        self.iv = iv
-        self.padding = padding_class(128)
+        self.legacy_iv = legacy_iv
+        # Built once and reused by every call, OpenSSL picks the AES-NI implementation when the CPU has it
+        self._aead = AESGCM(secret_key)
 
     def encrypt(self, data: str) -> bytes:
-        bytes_data = data.encode("utf-8")
-        encryptor = Cipher(algorithms.AES(self.secret_key), modes.GCM(self.iv), backend=default_backend()).encryptor()
-        padder = self.padding.padder()
-        padded_data = padder.update(bytes_data) + padder.finalize()
-        enctyped_data = encryptor.update(padded_data) + encryptor.finalize()
-        tag = encryptor.tag
-        return b64encode(tag + enctyped_data)
+        return b64encode(self.encrypt_bytes(data))
 
     def decrypt(self, data: bytes) -> str:
-        data = b64decode(data)
-        tag = data[:16]
-        encrypted_data = data[16:]
-        decryptor = Cipher(algorithms.AES(self.secret_key), modes.GCM(self.iv, tag), backend=default_backend()).decryptor()
-        unpadder = self.padding.unpadder()
-        decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
-        unpadded_data = unpadder.update(decrypted_data) + unpadder.finalize()
-        return unpadded_data.decode("utf-8")
+        raw = b64decode(data)
+        try:
+            return self._decrypt_raw(raw)
+        except InvalidTag:
+            if self.legacy_iv is None:
+                raise
+            return self._decrypt_legacy(raw)
+
+    def encrypt_bytes(self, data: str) -> bytes:
+        nonce = os.urandom(self.NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data.encode("utf-8"), None)
+
+    def decrypt_bytes(self, data: bytes) -> str:
+        try:
+            return self._decrypt_raw(data)
+        except InvalidTag:
+            if self.legacy_iv is None:
+                raise
+            # the previous engine stored the base64 text in binary columns too
+            return self._decrypt_legacy(b64decode(data))
+
+    def _decrypt_raw(self, data: bytes) -> str:
+        nonce = data[: self.NONCE_SIZE]
+        return self._aead.decrypt(nonce, data[self.NONCE_SIZE :], None).decode("utf-8")
+
+    def _decrypt_legacy(self, data: bytes) -> str:
+        """Decrypt the previous format: tag + ciphertext of the PKCS7 padded value, under the fixed `legacy_iv`."""
+        tag = data[: self.TAG_SIZE]
+        decryptor = Cipher(algorithms.AES(self.secret_key), modes.GCM(self.legacy_iv, tag)).decryptor()
+        padded = decryptor.update(data[self.TAG_SIZE :]) + decryptor.finalize()
+        unpadder = padding.PKCS7(algorithms.AES.block_size).unpadder()
+        return (unpadder.update(padded) + unpadder.finalize()).decode("utf-8")
+
+
+_default_engine: AESEngine | None = None
+_default_engine_lock = threading.Lock()
+
+
+def get_default_engine() -> AESEngine:
+    """
+    Process-wide AESEngine used by encrypted fields declared without an engine.
+    The key is read from the HYPERN_AES_KEY environment variable (base64 of a 16, 24 or 32 bytes key).
+    Setting HYPERN_AES_EPHEMERAL_KEY=1 instead uses a random per-process key, for development only:
+    data it encrypts can not be read by other processes or after a restart.
+    """
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                _default_engine = AESEngine(secret_key=_load_default_key())
+    return _default_engine
+
+
+def _load_default_key() -> bytes:
+    key = environ.get("HYPERN_AES_KEY")
+    if key:
+        return b64decode(key)
+    if environ.get("HYPERN_AES_EPHEMERAL_KEY") == "1":
+        logger.warning(
+            "HYPERN_AES_KEY is not set, encrypting with a random per-process key (HYPERN_AES_EPHEMERAL_KEY=1). "
+            "Values encrypted now can not be decrypted by other processes or after a restart, do not use this in production."
+        )
+        return os.urandom(32)
+    raise EnvironError("HYPERN_AES_KEY is not set. Set it to the base64 of a 16, 24 or 32 bytes key, or pass an engine to the encrypted field explicitly.")
@@ -1,18 +1,33 @@
 # -*- coding: utf-8 -*-
+import threading
 from typing import Any
 from celery import Celery
 from asgiref.sync import async_to_sync
 
 
 class AsyncCelery(Celery):
+    _instance = None
+    _lock = threading.Lock()
+
     def __new__(cls, *args, **kwargs) -> Any:
-        if not hasattr(cls, "instance") or not cls.instance:  # type: ignore
-            cls.instance = super().__new__(cls)
-        return cls.instance
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._patched = False
+                    cls._instance = instance
+        return cls._instance
 
     def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.patch_task()
+        # __init__ runs on every AsyncCelery() call, configure and patch the singleton only once
+        if self._patched:
+            return
+        with self._lock:
+            if self._patched:
+                return
+            super().__init__(*args, **kwargs)
+            self.patch_task()
+            self._patched = True
 
     def patch_task(self) -> None:
         TaskBase = self.Task
@@ -8,6 +8,8 @@ import platform
 import pytest
 import pathlib
 
+from tests.utils import get
+
 
 def spawn_process(command: List[str]) -> subprocess.Popen:
     if platform.system() == "Windows":
@@ -37,7 +39,8 @@ def start_server(domain: str, port: int) -> subprocess.Popen:
     # Start the server
     current_file_path = pathlib.Path(__file__).parent.resolve()
     server = os.path.join(current_file_path, "server.py")
-    command = ["python3", server, "--host", domain, "--port", str(port)]
+    # size workers and blocking threads to the machine, like a production start
+    command = ["python3", server, "--host", domain, "--port", str(port), "--auto-workers"]
     process = spawn_process(command)
 
     # Wait for the server to be reachable
@@ -63,5 +66,7 @@ def session():
     domain = "127.0.0.1"
     port = 5005
     process = start_server(domain, port)
+    # open the pooled keep-alive connection and let the server finish its lazy setup before the first measured test
+    get("/benchmark/sync")
     yield
     kill_process(process)
@@ -3,20 +3,25 @@ from hypern import Hypern, Request, Response
 from hypern.routing import HTTPEndpoint, Route
 from hypern.response import JSONResponse, HTMLResponse, PlainTextResponse, RedirectResponse, FileResponse
 
+import orjson
 from pydantic import BaseModel
 
 __base_route__ = "/benchmark"
 
 MESSAGE = "Hello World!"
+# the benchmark payloads never change, serialize them once
+MESSAGE_BODY = orjson.dumps({"message": MESSAGE})
+HTML_BODY = b"<h1>Hello World!</h1>"
+PLAIN_TEXT_BODY = MESSAGE.encode("utf-8")
 
 
 class DefaultRoute(HTTPEndpoint):
-    def post(self, request: Request):
-        return JSONResponse({"message": MESSAGE})
+    async def post(self, request: Request):
+        return JSONResponse(MESSAGE_BODY)
 
 
 class RequestFile(HTTPEndpoint):
-    def post(self, request: Request):
+    async def post(self, request: Request):
         return Response(
             status_code=200,
             description="multipart form data",
@@ -26,16 +31,16 @@ class RequestFile(HTTPEndpoint):
 
 class SyncQuery(HTTPEndpoint):
     def get(self, request: Request):
-        return JSONResponse({"message": MESSAGE})
+        return JSONResponse(MESSAGE_BODY)
 
 
 class AsyncQuery(HTTPEndpoint):
     async def get(self, request: Request):
-        return JSONResponse({"message": MESSAGE})
+        return JSONResponse(MESSAGE_BODY)
 
 
 class ResponseObject(HTTPEndpoint):
-    def get(self, request: Request):
+    async def get(self, request: Request):
         return Response(
             status_code=200,
             description={"message": MESSAGE},
@@ -52,37 +57,41 @@ class ModelResponse(BaseModel):
     message: str
 
 
+# constant reply, the response builder serializes model instances without re-validating them
+VALIDATE_GET_RESPONSE = ModelResponse(message=MESSAGE)
+
+
 class ValidateModel(HTTPEndpoint):
     def post(self, request: Request, form_data: ModelRequest) -> ModelResponse:
         return ModelResponse(message=f"Hello {form_data.name}! You are {form_data.age} years old.")
 
     async def get(self) -> ModelResponse:
-        return ModelResponse(message=MESSAGE)
+        return VALIDATE_GET_RESPONSE
 
 
 # response type
 class TestJsonResponse(HTTPEndpoint):
-    def post(self, request: Request):
+    async def post(self, request: Request):
         return JSONResponse({"message": MESSAGE})
 
 
 class TestHtmlResponse(HTTPEndpoint):
-    def post(self, request: Request):
-        return HTMLResponse("<h1>Hello World!</h1>")
+    async def post(self, request: Request):
+        return HTMLResponse(HTML_BODY)
 
 
 class TestPlainTextResponse(HTTPEndpoint):
-    def post(self, request: Request):
-        return PlainTextResponse("Hello World!")
+    async def post(self, request: Request):
+        return PlainTextResponse(PLAIN_TEXT_BODY)
 
 
 class TestRedirectResponse(HTTPEndpoint):
-    def post(self, request: Request):
+    async def post(self, request: Request):
         return RedirectResponse("/benchmark/default")
 
 
 class TestFileResponse(HTTPEndpoint):
-    def get(self, request: Request):
+    async def get(self, request: Request):
         return FileResponse(b"Hello", "hello.txt")
 
 
@@ -92,22 +101,22 @@ sync_route = Route("/sync")
 
 @functional_route.get("/default")
 def get(request: Request, query_params: ModelRequest):
-    return JSONResponse({"message": MESSAGE})
+    return JSONResponse(MESSAGE_BODY)
 
 
 @functional_route.post("/default")
 def post(request: Request, global_dependencies):
-    return JSONResponse({"message": MESSAGE})
+    return JSONResponse(MESSAGE_BODY)
 
 
 @functional_route.put("/default")
 def put(request: Request, router_dependencies):
-    return JSONResponse({"message": MESSAGE})
+    return JSONResponse(MESSAGE_BODY)
 
 
 @functional_route.delete("/default")
 def delete(request: Request):
-    return JSONResponse({"message": MESSAGE})
+    return JSONResponse(MESSAGE_BODY)
 
 
 routes = [
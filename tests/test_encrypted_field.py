@@ -0,0 +1,19 @@
+from hypern.db.addons.sqlalchemy.fields import LargeBinaryEncryptType
+from hypern.security import EDEngine
+
+
+class ReverseEngine(EDEngine):
+    # str in, str out, relies on the default encrypt_bytes/decrypt_bytes
+    def encrypt(self, data: str) -> str:
+        return data[::-1]
+
+    def decrypt(self, data: str) -> str:
+        return data[::-1]
+
+
+def test_large_binary_round_trip_with_text_engine():
+    field = LargeBinaryEncryptType(engine=ReverseEngine())
+    stored = field.process_bind_param("secret value", None)
+    assert stored == b"eulav terces"
+    assert field.process_result_value(stored, None) == "secret value"
+    assert field.process_result_value(memoryview(stored), None) == "secret value"
@@ -1,12 +1,12 @@
 import pytest
-from tests.utils import multipart_post
+from tests.utils import post
 
 
 # json
 @pytest.mark.benchmark
 @pytest.mark.parametrize("function_type", ["benchmark"])
 def test_json(function_type: str, session):
-    res = multipart_post(f"/{function_type}/json")
+    res = post(f"/{function_type}/json")
     assert res.status_code == 200
     assert res.json()
 
@@ -15,7 +15,7 @@ def test_json(function_type: str, session):
 @pytest.mark.benchmark
 @pytest.mark.parametrize("function_type", ["benchmark"])
 def test_html(function_type: str, session):
-    res = multipart_post(f"/{function_type}/html")
+    res = post(f"/{function_type}/html")
     assert res.status_code == 200
     assert res.text == "<h1>Hello World!</h1>"
 
@@ -24,7 +24,7 @@ def test_html(function_type: str, session):
 @pytest.mark.benchmark
 @pytest.mark.parametrize("function_type", ["benchmark"])
 def test_plain_text(function_type: str, session):
-    res = multipart_post(f"/{function_type}/plain_text")
+    res = post(f"/{function_type}/plain_text")
     assert res.status_code == 200
     assert res.text == "Hello World!"
 
@@ -33,6 +33,6 @@ def test_plain_text(function_type: str, session):
 @pytest.mark.benchmark
 @pytest.mark.parametrize("function_type", ["benchmark"])
 def test_redirect(function_type: str, session):
-    res = multipart_post(f"/{function_type}/redirect")
+    res = post(f"/{function_type}/redirect")
     assert res.status_code == 200
     assert "benchmark/default" in res.url
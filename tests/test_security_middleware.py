@@ -0,0 +1,66 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from hypern.hypern import Response
+from hypern.middleware.security import SecurityConfig, SecurityMiddleware
+
+
+def _middleware() -> SecurityMiddleware:
+    return SecurityMiddleware(SecurityConfig(jwt_auth=True, jwt_secret="secret"))
+
+
+def _token(exp: int, **user) -> str:
+    return jwt.encode({"user": user, "exp": exp}, "secret", algorithm="HS256")
+
+
+def _authenticate(middleware: SecurityMiddleware, token: str):
+    # before_request only reads the headers and method and sets request.user
+    request = SimpleNamespace(headers={"Authorization": f"Bearer {token}"}, method="GET", user=None)
+    return asyncio.run(middleware.before_request(request))
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    calls = []
+    decode = jwt.decode
+
+    def counting_decode(token, *args, **kwargs):
+        calls.append(token)
+        return decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    return calls
+
+
+def test_jwt_repeated_token_gets_unshared_payload(decode_calls):
+    middleware = _middleware()
+    token = _token(int(time.time()) + 3600, name="John")
+
+    first = _authenticate(middleware, token)
+    first.user["user"]["name"] = "changed"
+    first.user["admin"] = True
+    second = _authenticate(middleware, token)
+
+    assert second.user == {"user": {"name": "John"}, "exp": first.user["exp"]}
+    # the second request was served without verifying the signature again
+    assert decode_calls == [token]
+
+
+def test_jwt_expired_token_is_rejected_after_being_cached(decode_calls):
+    middleware = _middleware()
+    exp = int(time.time()) + 2
+    token = _token(exp, name="John")
+
+    assert _authenticate(middleware, token).user["user"] == {"name": "John"}
+    time.sleep(max(exp - time.time(), 0) + 0.1)
+
+    for _ in range(2):
+        response = _authenticate(middleware, token)
+        assert isinstance(response, Response)
+        assert response.status_code == 401
+    # the cached payload was not reused past the token's exp
+    assert decode_calls == [token, token, token]
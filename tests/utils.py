@@ -1,8 +1,15 @@
+import functools
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://127.0.0.1:5005"
+_URL_PREFIX = BASE_URL + "/"
+
+# one keep-alive session for every helper, so tests reuse sockets instead of connecting per request
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
 
 
 def check_response(response: requests.Response, expected_status_code: int):
@@ -25,8 +32,7 @@ def get(
     headers dict: The headers to send with the request.
     should_check_response bool: A boolean to indicate if the status code and headers should be checked.
     """
-    endpoint = endpoint.strip("/")
-    response = requests.get(f"{BASE_URL}/{endpoint}", headers=headers)
+    response = _SESSION.get(_URL_PREFIX + endpoint.lstrip("/"), headers=headers)
     if should_check_response:
         check_response(response, expected_status_code)
     return response
@@ -48,14 +54,19 @@ def post(
     headers dict: The headers to send with the request.
     should_check_response bool: A boolean to indicate if the status code and headers should be checked.
     """
-
-    endpoint = endpoint.strip("/")
-    response = requests.post(f"{BASE_URL}/{endpoint}", json=data, headers=headers)
+    response = _SESSION.post(_URL_PREFIX + endpoint.lstrip("/"), json=data, headers=headers)
     if should_check_response:
         check_response(response, expected_status_code)
     return response
 
 
+@functools.lru_cache(maxsize=None)
+def _encode_multipart(fields: tuple) -> tuple:
+    """Encode the multipart body once per distinct set of fields, returns (body, content type)."""
+    prepared = requests.Request("POST", BASE_URL, files=dict(fields)).prepare()
+    return prepared.body, prepared.headers["Content-Type"]
+
+
 def multipart_post(
     endpoint: str,
     files: Optional[dict] = None,
@@ -70,9 +81,11 @@ def multipart_post(
     expected_status_code int: The expected status code of the response.
     should_check_response bool: A boolean to indicate if the status code and headers should be checked.
     """
-
-    endpoint = endpoint.strip("/")
-    response = requests.post(f"{BASE_URL}/{endpoint}", files=files)
+    if files:
+        body, content_type = _encode_multipart(tuple(files.items()))
+        response = _SESSION.post(_URL_PREFIX + endpoint.lstrip("/"), data=body, headers={"Content-Type": content_type})
+    else:
+        response = _SESSION.post(_URL_PREFIX + endpoint.lstrip("/"))
     if should_check_response:
         check_response(response, expected_status_code)
     return response
@@ -93,9 +106,7 @@ def put(
     headers dict: The headers to send with the request.
     should_check_response bool: A boolean to indicate if the status code and headers should be checked.
     """
-
-    endpoint = endpoint.strip("/")
-    response = requests.put(f"{BASE_URL}/{endpoint}", json=data, headers=headers)
+    response = _SESSION.put(_URL_PREFIX + endpoint.lstrip("/"), json=data, headers=headers)
     if should_check_response:
         check_response(response, expected_status_code)
     return response
@@ -116,9 +127,7 @@ def delete(
     headers dict: The headers to send with the request.
     should_check_response bool: A boolean to indicate if the status code and headers should be checked.
     """
-
-    endpoint = endpoint.strip("/")
-    response = requests.delete(f"{BASE_URL}/{endpoint}", json=data, headers=headers)
+    response = _SESSION.delete(_URL_PREFIX + endpoint.lstrip("/"), json=data, headers=headers)
     if should_check_response:
         check_response(response, expected_status_code)
     return response